@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -21,6 +22,8 @@ class ImageHighlights:
 
 
 _CAPTION_PIPELINE: Optional[tuple[object, object, str]] = None
+# 여러 스레드가 동시에 캡셔닝 모델을 로드하지 않도록 보호한다.
+_CAPTION_PIPELINE_LOCK = threading.Lock()
 
 
 def _load_image(path: str):
@@ -43,24 +46,28 @@ def _load_caption_pipeline(model_name: str = "microsoft/git-base"):
     if _CAPTION_PIPELINE is not None:
         return _CAPTION_PIPELINE
 
-    try:
-        import torch  # type: ignore
-        from transformers import AutoModelForCausalLM, AutoProcessor  # type: ignore
-    except ImportError as exc:  # pragma: no cover - optional dependency
-        raise ImageExtractionError("이미지 캡셔닝을 위해 torch 및 transformers가 필요합니다.") from exc
+    with _CAPTION_PIPELINE_LOCK:
+        if _CAPTION_PIPELINE is not None:
+            return _CAPTION_PIPELINE
 
-    device = "cuda" if torch.cuda.is_available() else "cpu"
+        try:
+            import torch  # type: ignore
+            from transformers import AutoModelForCausalLM, AutoProcessor  # type: ignore
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImageExtractionError("이미지 캡셔닝을 위해 torch 및 transformers가 필요합니다.") from exc
 
-    try:
-        processor = AutoProcessor.from_pretrained(model_name)
-        model = AutoModelForCausalLM.from_pretrained(model_name)
-        model = model.to(device)
-        model.eval()
-    except Exception as exc:  # pragma: no cover - model load error
-        raise ImageExtractionError("이미지 캡셔닝 모델 로드에 실패했습니다.") from exc
-
-    _CAPTION_PIPELINE = (processor, model, device)
-    return _CAPTION_PIPELINE
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        try:
+            processor = AutoProcessor.from_pretrained(model_name)
+            model = AutoModelForCausalLM.from_pretrained(model_name)
+            model = model.to(device)
+            model.eval()
+        except Exception as exc:  # pragma: no cover - model load error
+            raise ImageExtractionError("이미지 캡셔닝 모델 로드에 실패했습니다.") from exc
+
+        _CAPTION_PIPELINE = (processor, model, device)
+        return _CAPTION_PIPELINE
 
 
 def generate_image_caption(path: str, *, max_length: int = 64) -> Optional[str]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from typing import Iterable, List, Sequence
 
 
@@ -11,6 +12,8 @@ class OcrExtractionError(RuntimeError):
 
 
 _OCR_READER = None
+# 이미지가 스레드풀에서 동시에 처리되므로 리더 생성을 한 번으로 제한한다.
+_OCR_READER_LOCK = threading.Lock()
 
 
 def _load_easyocr_reader():
@@ -21,17 +24,21 @@ def _load_easyocr_reader():
     if _OCR_READER is not None:
         return _OCR_READER
 
-    try:
-        import easyocr  # type: ignore
-    except ImportError as exc:  # pragma: no cover - optional dependency
-        raise OcrExtractionError("EasyOCR 라이브러리를 찾을 수 없습니다.") from exc
+    with _OCR_READER_LOCK:
+        if _OCR_READER is not None:
+            return _OCR_READER
 
-    try:
-        _OCR_READER = easyocr.Reader(["ko", "en"])  # type: ignore[call-arg]
-    except Exception as exc:  # pragma: no cover - library specific error
-        raise OcrExtractionError("EasyOCR 리더 초기화에 실패했습니다.") from exc
+        try:
+            import easyocr  # type: ignore
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise OcrExtractionError("EasyOCR 라이브러리를 찾을 수 없습니다.") from exc
 
-    return _OCR_READER
+        try:
+            _OCR_READER = easyocr.Reader(["ko", "en"])  # type: ignore[call-arg]
+        except Exception as exc:  # pragma: no cover - library specific error
+            raise OcrExtractionError("EasyOCR 리더 초기화에 실패했습니다.") from exc
+
+        return _OCR_READER
 
 
 def _calculate_box_height(bbox: Sequence[Sequence[float]]) -> float:
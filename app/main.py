@@ -3,30 +3,32 @@ import shutil
 import subprocess
 import platform
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query, status
+from fastapi import FastAPI, HTTPException, Query, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 
 logger = logging.getLogger(__name__)
 
 from app.schemas.folder import (
-    DevelopmentDirectoryInfo,
     FileOpenRequest,
     FileOpenResponse,
     FolderContentsResponse,
     FolderSelectionRequest,
     FolderSnapshotRequest,
     FolderSnapshotResponse,
-    SnapshotPageInfo,
     SortBy,
     SortOrder,
     StorageInfoResponse,
 )
 from app.services.folder_inspection import DirectoryInspectionError, inspect_directory
 from app.services.folder_snapshot import snapshot_directory
+from app.services.organized_file_client import close_organized_file_client
+from app.services.snapshot_delivery import close_snapshot_delivery_client
 from app.routers import organized_files
 
 
@@ -38,7 +40,15 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-app = FastAPI(title="Nebula Client API")
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    # 공유 Spring 클라이언트 및 스냅샷 전송 클라이언트의 커넥션 풀 정리
+    await close_organized_file_client()
+    close_snapshot_delivery_client()
+
+
+app = FastAPI(title="Nebula Client API", lifespan=lifespan)
 
 # CORS 미들웨어 설정 - 모든 오리진, 메서드, 헤더 허용
 app.add_middleware(
@@ -79,36 +89,20 @@ def inspect_folder(payload: FolderSelectionRequest) -> FolderContentsResponse:
 
 
 @app.post("/folders/snapshot", response_model=FolderSnapshotResponse)
-def snapshot_folder(payload: FolderSnapshotRequest) -> FolderSnapshotResponse:
+def snapshot_folder(payload: FolderSnapshotRequest) -> Response:
     try:
-        result = snapshot_directory(payload.path, payload.page_size)
+        result = snapshot_directory(payload.path, payload.page_size, persist=payload.persist)
     except DirectoryInspectionError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
 
-    return FolderSnapshotResponse(
-        directory=result.directory,
-        generated_at=result.generated_at,
-        total_entries=result.total_entries,
-        page_size=result.page_size,
-        page_count=result.page_count,
-        pages=[
-            SnapshotPageInfo(
-                page=page.page,
-                path=str(page.path),
-                entry_count=page.entry_count,
-            )
-            for page in result.pages
-        ],
-        development_directories=[
-            DevelopmentDirectoryInfo(
-                relative_path=entry.relative_path,
-                absolute_path=entry.absolute_path,
-            )
-            for entry in result.development_directories
-        ],
+    # 응답 모델 검증과 jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화한다.
+    # 본문 구성은 FolderSnapshotResult.to_response_dict()가 FolderSnapshotResponse에 맞춰 만든다.
+    return Response(
+        content=orjson.dumps(result.to_response_dict(), option=orjson.OPT_UTC_Z),
+        media_type="application/json",
     )
 
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 
 from app.schemas.folder import FolderSelectionRequest
@@ -18,6 +18,7 @@ from app.services.folder_inspection import (
 from app.services.organized_file_client import (
     OrganizedFileClient,
     OrganizedFileClientError,
+    get_organized_file_client,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,7 @@ router = APIRouter(prefix="/api", tags=["organized-files"])
 async def inspect_and_organize_folder(
     payload: FolderSelectionRequest,
     page_size: int = 100,
+    spring_client: OrganizedFileClient = Depends(get_organized_file_client),
 ) -> JSONResponse:
     """
     폴더를 검사하고 파일에서 키워드를 추출한 후 Spring 서버로 전달
@@ -107,8 +109,6 @@ async def inspect_and_organize_folder(
         total_failed = 0
         all_error_messages = []
 
-        spring_client = OrganizedFileClient()
-
         # 페이지 수 계산
         total_pages = (total_files + page_size - 1) // page_size
 
@@ -143,6 +143,8 @@ async def inspect_and_organize_folder(
                 )
             except OrganizedFileClientError as exc:
                 logger.error(f"페이지 {page_num + 1} 전송 실패: {exc}")
+                # 페이지의 모든 청크가 실패한 경우에만 여기로 온다.
+                # (일부 청크만 실패하면 spring_response.failed_count에 포함되어 돌아온다)
                 # 한 페이지 실패해도 계속 진행
                 total_failed += len(page_entries)
                 all_error_messages.append(f"페이지 {page_num + 1} 전송 실패: {str(exc)}")
@@ -197,6 +199,7 @@ async def inspect_and_organize_folder(
 @router.post("/folders/inspect-and-organize/batch")
 async def inspect_and_organize_batch(
     payload: FolderSelectionRequest,
+    spring_client: OrganizedFileClient = Depends(get_organized_file_client),
 ) -> JSONResponse:
     """
     폴더를 검사하고 배치 단위로 Spring 서버로 전달 (대용량 파일 처리용)
@@ -246,6 +249,7 @@ async def inspect_and_organize_batch(
             _process_batches_in_background(
                 batches=batches,
                 directory_root=Path(folder_response.directory),
+                spring_client=spring_client,
             )
         )
 
@@ -280,10 +284,10 @@ async def inspect_and_organize_batch(
 async def _process_batches_in_background(
     batches: list[list],
     directory_root: Path,
+    spring_client: OrganizedFileClient,
 ) -> None:
     """백그라운드에서 배치를 순차적으로 처리"""
     user_id = "621c7d3957c2ea5b9063d04c"  # TODO: 실제 사용자 ID 사용
-    spring_client = OrganizedFileClient()
 
     for batch_num, batch_entries in enumerate(batches, start=1):
         try:
@@ -333,6 +337,7 @@ async def _process_batches_in_background(
 async def inspect_and_organize_with_generation(
     payload: FolderSelectionRequest,
     page_size: int = 100,
+    spring_client: OrganizedFileClient = Depends(get_organized_file_client),
 ) -> JSONResponse:
     """
     폴더를 검사하고 새로운 Generation 포맷으로 Spring 서버로 전달
@@ -408,8 +413,6 @@ async def inspect_and_organize_with_generation(
         total_failed = 0
         all_error_messages = []
 
-        spring_client = OrganizedFileClient()
-
         # 페이지 수 계산
         total_pages = (total_files + page_size - 1) // page_size
 
@@ -444,6 +447,8 @@ async def inspect_and_organize_with_generation(
                 )
             except OrganizedFileClientError as exc:
                 logger.error(f"Generation 페이지 {page_num + 1} 전송 실패: {exc}")
+                # 페이지의 모든 청크가 실패한 경우에만 여기로 온다.
+                # (일부 청크만 실패하면 spring_response.failed_count에 포함되어 돌아온다)
                 # 한 페이지 실패해도 계속 진행
                 total_failed += len(page_entries)
                 all_error_messages.append(
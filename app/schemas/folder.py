@@ -65,13 +65,22 @@ class FolderSnapshotRequest(BaseModel):
             "Optional page size for chunking large snapshots into multiple JSON files."
         ),
     )
+    persist: bool = Field(
+        True,
+        description=(
+            "Write each page to SNAPSHOT_DIR; when false pages are only delivered to the server."
+        ),
+    )
 
 
 class SnapshotPageInfo(BaseModel):
     """Metadata about a written snapshot JSON file."""
 
     page: int = Field(..., ge=1, description="1-based page index.")
-    path: str = Field(..., description="Filesystem path to the generated JSON file.")
+    path: Optional[str] = Field(
+        None,
+        description="Filesystem path to the generated JSON file; null when the snapshot was not persisted.",
+    )
     entry_count: int = Field(..., ge=0, description="Number of directory entries in this page.")
 
 
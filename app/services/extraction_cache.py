@@ -0,0 +1,139 @@
+"""Persist file extraction results keyed by filesystem identity.
+
+Snapshots of the same tree are taken repeatedly, and most files do not
+change between runs. Entries are keyed by ``(st_dev, st_ino)`` and only
+count as a hit while ``st_mtime_ns``, ``st_size`` and the file extension
+still match, so an edited or renamed file is always re-extracted. The database carries ``_CACHE_VERSION``
+in ``PRAGMA user_version`` and is emptied whenever that version changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import orjson
+
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILENAME = "extraction_cache.sqlite3"
+
+# 추출기 동작이나 저장 형식이 바뀌면 올린다. 버전이 다르면 기존 행을 모두 버린다.
+_CACHE_VERSION = 3
+
+FileKey = Tuple[int, int, int, int]
+"""``(st_dev, st_ino, st_mtime_ns, st_size)`` of a regular file."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    suffix TEXT NOT NULL,
+    keywords BLOB,
+    caption TEXT,
+    PRIMARY KEY (dev, ino)
+)
+"""
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    """Stored extraction outcome; ``highlights`` is None for files with no content."""
+
+    highlights: Optional[List[str]]
+    caption: Optional[str] = None
+
+
+def file_key(stats: os.stat_result) -> Optional[FileKey]:
+    """Return the cache key for ``stats``, or None when the platform has no inode."""
+
+    # Windows의 DirEntry.stat()은 st_ino/st_dev를 0으로 채우므로 키로 쓸 수 없다.
+    if not stats.st_ino:
+        return None
+    return (stats.st_dev, stats.st_ino, stats.st_mtime_ns, stats.st_size)
+
+
+class ExtractionCache:
+    """SQLite-backed cache of highlights and captions per file."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        # 추출은 요청 스레드마다 호출되므로 연결 하나를 잠금으로 보호해 공유한다.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != _CACHE_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS extraction_cache")
+            self._connection.execute(f"PRAGMA user_version = {_CACHE_VERSION}")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def get(self, key: FileKey, suffix: str) -> Optional[CachedExtraction]:
+        """Return the stored result for ``key`` if it was extracted under ``suffix``.
+
+        ``suffix`` is the lowercased file extension. It picks the extractor, so a
+        renamed or hard-linked file with another extension is treated as a miss.
+        """
+        dev, ino, mtime_ns, size = key
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime_ns, size, suffix, keywords, caption FROM extraction_cache "
+                "WHERE dev = ? AND ino = ?",
+                (dev, ino),
+            ).fetchone()
+        if row is None or row[0] != mtime_ns or row[1] != size or row[2] != suffix:
+            return None
+        highlights = orjson.loads(row[3]) if row[3] is not None else None
+        return CachedExtraction(highlights=highlights, caption=row[4])
+
+    def put(
+        self,
+        key: FileKey,
+        suffix: str,
+        highlights: Optional[List[str]],
+        caption: Optional[str],
+    ) -> None:
+        dev, ino, mtime_ns, size = key
+        keywords = orjson.dumps(highlights) if highlights is not None else None
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO extraction_cache "
+                "(dev, ino, mtime_ns, size, suffix, keywords, caption) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (dev, ino, mtime_ns, size, suffix, keywords, caption),
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+_caches: dict[Path, ExtractionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def open_extraction_cache(directory: Path) -> Optional[ExtractionCache]:
+    """Return the shared cache stored under ``directory``, or None if it cannot be opened."""
+
+    db_path = directory / _CACHE_FILENAME
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            try:
+                cache = ExtractionCache(db_path)
+            except sqlite3.Error as exc:
+                logger.warning("추출 캐시를 열 수 없습니다: path=%s, error=%s", db_path, exc)
+                return None
+            _caches[db_path] = cache
+        return cache
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import os
+import sys
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, List, Optional
@@ -22,7 +24,7 @@ class DirectoryInspectionError(Exception):
     """Raised when a directory cannot be inspected."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectoryEntry:
     """Internal representation of a directory entry."""
 
@@ -39,16 +41,16 @@ class DirectoryEntry:
             object.__setattr__(self, 'keywords', [])
 
     @classmethod
-    def from_path(cls, entry_path: Path, keywords: Optional[List[str]] = None, is_development: bool = False) -> "DirectoryEntry":
-        stats = entry_path.stat()
+    def from_dir_entry(cls, entry: os.DirEntry) -> "DirectoryEntry":
+        """``os.scandir`` 결과로 생성 (캐시된 파일 유형과 stat 재사용)"""
+        stats = entry.stat()
+        is_directory = entry.is_dir()
         return cls(
-            name=entry_path.name,
-            path=entry_path,
-            is_directory=entry_path.is_dir(),
-            size_bytes=0 if entry_path.is_dir() else stats.st_size,
+            name=entry.name,
+            path=Path(entry.path),
+            is_directory=is_directory,
+            size_bytes=0 if is_directory else stats.st_size,
             modified_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
-            keywords=keywords or [],
-            is_development=is_development,
         )
 
 
@@ -72,10 +74,12 @@ def resolve_directory(raw_path: str) -> Path:
 
 def _iter_directory_entries(directory: Path) -> Iterable[DirectoryEntry]:
     try:
-        for entry in sorted(directory.iterdir(), key=lambda p: p.name.lower()):
+        with os.scandir(directory) as iterator:
+            children = sorted(iterator, key=lambda entry: entry.name.lower())
+        for entry in children:
             if entry.name.startswith("."):
                 continue
-            yield DirectoryEntry.from_path(entry)
+            yield DirectoryEntry.from_dir_entry(entry)
     except PermissionError as exc:
         raise DirectoryInspectionError("디렉터리에 접근 권한이 없습니다.") from exc
 
@@ -210,9 +214,9 @@ async def inspect_directory_with_keywords(
         # 개발 여부 판단
         is_development = _is_development_file(entry.path)
 
-        # 키워드가 포함된 DirectoryEntry 생성
-        entry_with_keywords = DirectoryEntry.from_path(
-            entry.path,
+        # 키워드가 포함된 DirectoryEntry 생성 (scandir에서 얻은 stat 결과를 그대로 사용)
+        entry_with_keywords = replace(
+            entry,
             keywords=keywords,
             is_development=is_development,
         )
@@ -235,6 +239,11 @@ async def inspect_directory_with_keywords(
     return response, entries_with_keywords
 
 
+def _intern_keywords(keywords: List[str]) -> List[str]:
+    """반복되는 키워드 문자열을 intern하여 대량 변환 시 같은 키워드가 객체 하나를 공유하도록 함"""
+    return [sys.intern(keyword) if type(keyword) is str else keyword for keyword in keywords]
+
+
 def to_organized_file_entry(
     directory_root: Path,
     entry: DirectoryEntry,
@@ -270,18 +279,20 @@ def to_organized_file_entry(
     # 상대 경로
     relative_path = str(entry.path.relative_to(directory_root))
 
+    keywords = _intern_keywords(entry.keywords)
+
     return OrganizedFileEntry(
         original_relative_path=relative_path,
         directory=entry.is_directory,
         development=entry.is_development,
         size_bytes=entry.size_bytes,
         modified_at=entry.modified_at,
-        keywords=entry.keywords,
+        keywords=keywords,
         korean_file_name=korean_file_name,
         english_file_name=english_file_name,
         para_bucket=para_bucket,
         para_folder=None,
-        reason=f"Automatically organized by ML extraction. Keywords: {', '.join(entry.keywords) if entry.keywords else 'No keywords'}"
+        reason=f"Automatically organized by ML extraction. Keywords: {', '.join(keywords) if keywords else 'No keywords'}"
     )
 
 
@@ -312,5 +323,5 @@ def to_file_entry_for_generation(
         size_bytes=entry.size_bytes,
         modified_at=entry.modified_at.isoformat(),  # ISO 8601 형식 문자열로 변환
         is_development=entry.is_development,
-        keywords=entry.keywords,
+        keywords=_intern_keywords(entry.keywords),
     )
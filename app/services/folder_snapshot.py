@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import os
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+import orjson
 
 from app.extraction.handlers.image import (
     ImageExtractionError,
@@ -20,6 +23,12 @@ from app.extraction.handlers.xls import (
     SpreadsheetExtractionError,
     build_summary_text,
 )
+from app.services.extraction_cache import (
+    ExtractionCache,
+    FileKey,
+    file_key,
+    open_extraction_cache,
+)
 from app.services.folder_inspection import DirectoryInspectionError, resolve_directory
 from app.services.snapshot_delivery import send_snapshot_payload
 
@@ -30,7 +39,7 @@ _SNAPSHOT_ENV_VAR = "SNAPSHOT_DIR"
 _DEFAULT_SNAPSHOT_DIR = "snapshots"
 _AUTO_BATCH_SIZE = 50
 
-_DEVELOPMENT_DIRECTORY_MARKERS = {
+_DEVELOPMENT_DIRECTORY_MARKERS = frozenset({
     ".git",
     ".hg",
     ".svn",
@@ -38,9 +47,9 @@ _DEVELOPMENT_DIRECTORY_MARKERS = {
     ".vscode",
     ".venv",
     "node_modules",
-}
+})
 
-_DEVELOPMENT_FILE_MARKERS = {
+_DEVELOPMENT_FILE_MARKERS = frozenset({
     "package.json",
     "package-lock.json",
     "pnpm-lock.yaml",
@@ -55,10 +64,26 @@ _DEVELOPMENT_FILE_MARKERS = {
     "Cargo.toml",
     "go.mod",
     "Gemfile",
-}
+})
+
+# 대부분의 항목은 마커가 아니므로 합친 집합으로 한 번에 걸러낸다.
+_DEVELOPMENT_MARKERS = _DEVELOPMENT_DIRECTORY_MARKERS | _DEVELOPMENT_FILE_MARKERS
 
 
 _IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tiff")
+_SPREADSHEET_EXTENSIONS = (".xlsx", ".xls", ".xlsm", ".csv")
+_EXTRACTABLE_EXTENSIONS = (".pdf", *_IMAGE_EXTENSIONS, *_SPREADSHEET_EXTENSIONS)
+
+_EXTRACTION_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="snapshot-extract",
+)
+
+# PyMuPDF(fitz)는 스레드 안전하지 않으므로 PDF 추출은 프로세스 전체에서 한 번에 하나만 실행한다.
+_PDF_EXTRACTION_LOCK = threading.Lock()
+
+# 페이지 파일 쓰기는 다음 페이지의 추출/전송과 겹쳐 실행한다.
+_WRITER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="snapshot-write")
 
 
 @dataclass(frozen=True)
@@ -68,7 +93,7 @@ class FileInsights:
     highlights: List[str]
     caption: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SnapshotEntry:
     """Structured metadata describing a filesystem entry."""
 
@@ -78,24 +103,35 @@ class SnapshotEntry:
     size_bytes: int
     modified_at: datetime
     is_development: bool = False
+    # 추출 캐시 키 (st_dev, st_ino, st_mtime_ns, st_size). 디렉터리는 None.
+    file_key: Optional[FileKey] = field(default=None, compare=False, repr=False)
 
     @classmethod
-    def from_path(cls, root: Path, path: Path, *, is_development: bool = False) -> "SnapshotEntry":
+    def from_dir_entry(
+        cls, root_prefix_length: int, entry: os.DirEntry, *, is_development: bool = False
+    ) -> "SnapshotEntry":
+        """Build an entry from ``os.scandir`` output, reusing its cached type and stat.
+
+        ``root_prefix_length`` is the length of the snapshot root including its
+        trailing separator; ``entry.path`` always starts with that prefix, so the
+        relative path is a plain slice rather than ``Path.relative_to``.
+        """
         try:
-            stats = path.stat()
+            stats = entry.stat()
         except FileNotFoundError as exc:
             raise DirectoryInspectionError("스냅샷 대상 파일을 찾을 수 없습니다.") from exc
         except PermissionError as exc:
             raise DirectoryInspectionError("파일에 접근 권한이 없습니다.") from exc
 
-        is_directory = path.is_dir()
+        is_directory = entry.is_dir()
         return cls(
-            relative_path=str(path.relative_to(root)),
-            absolute_path=str(path),
+            relative_path=entry.path[root_prefix_length:],
+            absolute_path=entry.path,
             is_directory=is_directory,
             size_bytes=0 if is_directory else stats.st_size,
             modified_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc),
             is_development=is_development,
+            file_key=None if is_directory else file_key(stats),
         )
 
     def to_dict(self) -> dict[str, object]:
@@ -114,9 +150,16 @@ class SnapshotPage:
     """Represents a single JSON snapshot file for a directory."""
 
     page: int
-    path: Path
+    path: Optional[Path]
     entry_count: int
 
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "page": self.page,
+            "path": str(self.path) if self.path is not None else None,
+            "entry_count": self.entry_count,
+        }
+
 
 @dataclass(frozen=True)
 class FolderSnapshotResult:
@@ -133,9 +176,43 @@ class FolderSnapshotResult:
     def page_count(self) -> int:
         return len(self.pages)
 
+    def to_response_dict(self) -> dict[str, object]:
+        """Return the ``FolderSnapshotResponse`` body as plain data for orjson.
+
+        ``generated_at`` stays a ``datetime`` so the caller can pick the
+        serialization (``orjson.OPT_UTC_Z`` matches pydantic's output).
+        """
+        return {
+            "directory": self.directory,
+            "generated_at": self.generated_at,
+            "total_entries": self.total_entries,
+            "page_size": self.page_size,
+            "page_count": self.page_count,
+            "pages": [page.to_dict() for page in self.pages],
+            "development_directories": [
+                {
+                    "relative_path": entry.relative_path,
+                    "absolute_path": entry.absolute_path,
+                }
+                for entry in self.development_directories
+            ],
+        }
+
+
+def snapshot_directory(
+    raw_path: str,
+    page_size: Optional[int] = None,
+    *,
+    use_cache: bool = True,
+    persist: bool = True,
+) -> FolderSnapshotResult:
+    """Traverse a directory recursively and persist metadata snapshots to disk.
 
-def snapshot_directory(raw_path: str, page_size: Optional[int] = None) -> FolderSnapshotResult:
-    """Traverse a directory recursively and persist metadata snapshots to disk."""
+    With ``use_cache`` enabled, PDF/image/spreadsheet extraction results are
+    reused for files whose inode, mtime and size are unchanged since a
+    previous snapshot. With ``persist`` disabled, pages are only delivered to
+    the server and no JSON files are written.
+    """
 
     directory = resolve_directory(raw_path)
     logger.info('디렉터리 스냅샷 시작: path=%s, page_size=%s', directory, page_size)
@@ -150,12 +227,18 @@ def snapshot_directory(raw_path: str, page_size: Optional[int] = None) -> Folder
         chunks = [entries]
 
     snapshot_root = _ensure_snapshot_root()
+    extraction_cache = open_extraction_cache(snapshot_root) if use_cache else None
     pages: List[SnapshotPage] = []
+    pending_writes: list[Future[None]] = []
 
     for index, chunk in enumerate(chunks, start=1):
-        output_path = _build_snapshot_path(snapshot_root, directory, generated_at, index, len(chunks))
+        output_path = (
+            _build_snapshot_path(snapshot_root, directory, generated_at, index, len(chunks))
+            if persist
+            else None
+        )
         logger.info(
-            '스냅샷 파일 생성: path=%s, page=%d/%d, entries=%d',
+            '스냅샷 페이지 생성: path=%s, page=%d/%d, entries=%d',
             output_path,
             index,
             len(chunks),
@@ -170,9 +253,15 @@ def snapshot_directory(raw_path: str, page_size: Optional[int] = None) -> Folder
             page_count=len(chunks),
             page_size=effective_page_size,
             entries=chunk,
+            extraction_cache=extraction_cache,
         )
         send_snapshot_payload(page_payload)
-        _write_snapshot_file(
+        if output_path is None:
+            # 서버 전송만 필요한 경우 디스크 쓰기를 건너뛴다.
+            pages.append(SnapshotPage(page=index, path=None, entry_count=len(chunk)))
+            continue
+        write_future = _WRITER_POOL.submit(
+            _write_snapshot_file,
             output_path=output_path,
             directory=directory,
             generated_at=generated_at,
@@ -182,8 +271,13 @@ def snapshot_directory(raw_path: str, page_size: Optional[int] = None) -> Folder
             page_size=effective_page_size,
             entries=chunk,
         )
+        pending_writes.append(write_future)
         pages.append(SnapshotPage(page=index, path=output_path, entry_count=len(chunk)))
 
+    # 응답에 포함된 경로는 모두 존재해야 하므로 반환 전에 쓰기 완료를 기다리고 오류를 전파한다.
+    for pending_write in pending_writes:
+        pending_write.result()
+
     return FolderSnapshotResult(
         directory=str(directory),
         generated_at=generated_at,
@@ -205,61 +299,77 @@ def _ensure_snapshot_root() -> Path:
 
 
 def _iter_snapshot_entries(root: Path) -> Iterable[SnapshotEntry]:
-    def walk(current: Path) -> Iterable[SnapshotEntry]:
-        try:
-            children = [child for child in current.iterdir() if not child.name.startswith(".")]
-        except PermissionError as exc:
-            raise DirectoryInspectionError("디렉터리에 접근 권한이 없습니다.") from exc
-
-        directories: list[Path] = []
-        files: list[Path] = []
-
-        for child in children:
-            if child.is_dir():
-                directories.append(child)
-            else:
-                files.append(child)
-
-        directories.sort(key=lambda path: path.name.lower())
-        files.sort(key=lambda path: path.name.lower())
-
-        for directory_path in directories:
-            is_development = _is_development_directory(directory_path)
-            if is_development:
-                yield SnapshotEntry.from_path(
-                    root,
-                    directory_path,
+    # 재귀 제너레이터 대신 명시적 스택으로 순회해 디렉터리마다 프레임이 쌓이지 않게 한다.
+    # 각 프레임은 (남은 하위 디렉터리, 파일 목록, 프레임을 연 디렉터리)이며,
+    # 하위 디렉터리를 모두 소진하면 파일과 디렉터리 자신을 내보내 깊이 우선 후위 순서를 유지한다.
+    root_prefix_length = len(os.path.join(str(root), ""))
+    directories, files = _list_children(root)
+    stack: list[tuple[Iterator[os.DirEntry], list[os.DirEntry], Optional[os.DirEntry]]] = [
+        (iter(directories), files, None)
+    ]
+
+    while stack:
+        pending_directories, files, owner = stack[-1]
+
+        for directory_entry in pending_directories:
+            directory_path = Path(directory_entry.path)
+            if _is_development_directory(directory_path):
+                yield SnapshotEntry.from_dir_entry(
+                    root_prefix_length,
+                    directory_entry,
                     is_development=True,
                 )
                 continue
             # 가장 깊은 경로부터 순차적으로 처리하기 위해 먼저 하위 항목을 순회한다.
-            yield from walk(directory_path)
-            yield SnapshotEntry.from_path(root, directory_path)
+            child_directories, child_files = _list_children(directory_path)
+            stack.append((iter(child_directories), child_files, directory_entry))
+            break
+        else:
+            stack.pop()
+            for file_entry in files:
+                yield SnapshotEntry.from_dir_entry(root_prefix_length, file_entry)
+            if owner is not None:
+                yield SnapshotEntry.from_dir_entry(root_prefix_length, owner)
 
-        for file_path in files:
-            yield SnapshotEntry.from_path(root, file_path)
 
-    yield from walk(root)
+def _list_children(current: Path) -> tuple[list[os.DirEntry], list[os.DirEntry]]:
+    """Return visible child directories and files of ``current``, each sorted by name."""
+
+    # scandir이 반환하는 DirEntry는 파일 유형과 stat 결과를 캐시하므로 항목당 stat은 최대 한 번이다.
+    try:
+        with os.scandir(current) as iterator:
+            children = [child for child in iterator if not child.name.startswith(".")]
+    except PermissionError as exc:
+        raise DirectoryInspectionError("디렉터리에 접근 권한이 없습니다.") from exc
+
+    directories: list[os.DirEntry] = []
+    files: list[os.DirEntry] = []
+
+    for child in children:
+        if child.is_dir():
+            directories.append(child)
+        else:
+            files.append(child)
+
+    directories.sort(key=lambda entry: entry.name.lower())
+    files.sort(key=lambda entry: entry.name.lower())
+    return directories, files
 
 
 def _is_development_directory(path: Path) -> bool:
     """Return True when directory appears to be a development project root."""
 
-    for marker in _DEVELOPMENT_DIRECTORY_MARKERS:
-        candidate = path / marker
-        try:
-            if candidate.exists():
-                return True
-        except OSError:
-            continue
-
-    for marker in _DEVELOPMENT_FILE_MARKERS:
-        candidate = path / marker
-        try:
-            if candidate.is_file():
-                return True
-        except OSError:
-            continue
+    # 마커마다 stat을 호출하는 대신 디렉터리를 한 번만 나열해 이름으로 판별한다.
+    try:
+        with os.scandir(path) as iterator:
+            for entry in iterator:
+                name = entry.name
+                if name not in _DEVELOPMENT_MARKERS:
+                    continue
+                if name in _DEVELOPMENT_DIRECTORY_MARKERS or entry.is_file():
+                    return True
+    except OSError:
+        return False
 
     return False
 
@@ -322,8 +432,9 @@ def _write_snapshot_file(
     }
 
     try:
-        with output_path.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, ensure_ascii=False, indent=2)
+        # orjson은 UTF-8 바이트를 직접 만들어 문자열 생성과 인코딩 단계를 건너뛴다.
+        with output_path.open("wb") as fp:
+            fp.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     except OSError as exc:
         raise DirectoryInspectionError("스냅샷 파일을 저장할 수 없습니다.") from exc
 
@@ -337,10 +448,11 @@ def _serialize_snapshot_page(
     page_count: int,
     page_size: Optional[int],
     entries: list[SnapshotEntry],
+    extraction_cache: Optional[ExtractionCache] = None,
 ) -> dict[str, object]:
     """Convert a snapshot page into a camelCase payload for the remote server."""
 
-    file_insights = _collect_file_insights(entries)
+    file_insights = _collect_file_insights(entries, extraction_cache)
 
     return {
         "directory": str(directory),
@@ -378,92 +490,155 @@ def _serialize_snapshot_entry(
     return payload
 
 
-def _collect_file_insights(entries: list[SnapshotEntry]) -> dict[str, FileInsights]:
+def _collect_file_insights(
+    entries: list[SnapshotEntry],
+    extraction_cache: Optional[ExtractionCache] = None,
+) -> dict[str, FileInsights]:
     """Return a mapping of absolute paths to extracted highlights and prompts."""
 
     insights: dict[str, FileInsights] = {}
+    pending: list[SnapshotEntry] = []
+
     for entry in entries:
-        if entry.is_directory:
+        if entry.is_directory or not entry.absolute_path.lower().endswith(_EXTRACTABLE_EXTENSIONS):
             continue
+        if extraction_cache is not None and entry.file_key is not None:
+            cached = extraction_cache.get(entry.file_key, _extension_of(entry))
+            if cached is not None:
+                # 내용이 없던 파일도 음성 결과로 캐시되어 있으므로 다시 추출하지 않는다.
+                if cached.highlights:
+                    insights[entry.absolute_path] = FileInsights(
+                        highlights=cached.highlights,
+                        caption=cached.caption,
+                    )
+                continue
+        pending.append(entry)
+
+    if not pending:
+        return insights
+
+    # PyMuPDF는 스레드 안전하지 않으므로 PDF는 현재 스레드에서 순차 처리하고,
+    # 이미지/스프레드시트만 스레드풀로 보내 PDF 처리와 겹쳐 실행한다.
+    pdf_entries = [entry for entry in pending if entry.absolute_path.lower().endswith(".pdf")]
+    other_entries = [entry for entry in pending if not entry.absolute_path.lower().endswith(".pdf")]
+
+    other_futures = [
+        _EXTRACTION_POOL.submit(_extract_file_insights, entry.absolute_path)
+        for entry in other_entries
+    ]
+    results = [_extract_file_insights(entry.absolute_path) for entry in pdf_entries]
+    results.extend(future.result() for future in other_futures)
+
+    for entry, (file_insights, succeeded) in zip(pdf_entries + other_entries, results):
+        if file_insights is not None:
+            insights[entry.absolute_path] = file_insights
+        # 추출 오류는 일시적일 수 있으므로 정상적으로 끝난 결과만 캐시한다.
+        if succeeded and extraction_cache is not None and entry.file_key is not None:
+            extraction_cache.put(
+                entry.file_key,
+                _extension_of(entry),
+                file_insights.highlights if file_insights else None,
+                file_insights.caption if file_insights else None,
+            )
 
-        absolute_path = entry.absolute_path
-        lower_path = absolute_path.lower()
+    return insights
 
-        try:
-            if lower_path.endswith(".pdf"):
-                highlights = extract_pdf_keywords(absolute_path)
-                if not highlights:
-                    continue
-                insights[absolute_path] = FileInsights(
-                    highlights=highlights,
-                    caption=None,
-                )
-            elif lower_path.endswith(_IMAGE_EXTENSIONS):
-                image_highlights = extract_image_highlights(absolute_path)
-                combined_lines = list(image_highlights.ocr_lines)
 
-                if image_highlights.caption:
-                    if image_highlights.caption not in combined_lines:
-                        combined_lines.append(image_highlights.caption)
+def _extension_of(entry: SnapshotEntry) -> str:
+    # 확장자가 추출기를 결정하므로 같은 inode라도 확장자가 바뀌면 캐시를 쓰지 않는다.
+    return os.path.splitext(entry.absolute_path)[1].lower()
 
-                if not combined_lines:
-                    continue
-                insights[absolute_path] = FileInsights(
-                    highlights=combined_lines,
-                    caption=image_highlights.caption,
-                )
-            elif lower_path.endswith((".xlsx", ".xls", ".xlsm", ".csv")):
-                summary_text, signals = build_summary_text(absolute_path)
-                summary_text = summary_text.strip()
-
-                candidate_highlights: list[str] = []
-                seen_highlights: set[str] = set()
-                for value in (
-                    signals.sections
-                    + signals.banner
-                    + signals.headers
-                    + signals.samples
-                ):
-                    cleaned = value.strip()
-                    if not cleaned:
-                        continue
-                    lowered = cleaned.lower()
-                    if lowered in seen_highlights:
-                        continue
-                    candidate_highlights.append(cleaned)
-                    seen_highlights.add(lowered)
-                    if len(candidate_highlights) >= 40:
-                        break
-
-                if not candidate_highlights and summary_text:
-                    candidate_highlights.append(summary_text)
-
-                if not candidate_highlights:
-                    continue
 
-                insights[absolute_path] = FileInsights(
-                    highlights=candidate_highlights,
-                    caption=summary_text or None,
-                )
+def _extract_file_insights(absolute_path: str) -> tuple[Optional[FileInsights], bool]:
+    """Extract highlights for a single file.
 
+    Returns the insights (None when nothing is found) and whether extraction
+    completed without an extractor error.
+    """
 
-        except PdfExtractionError as exc:
-            logger.warning(
-                "PDF 키워드 추출 실패: path=%s, error=%s",
-                absolute_path,
-                exc,
-            )
-        except ImageExtractionError as exc:
-            logger.warning(
-                "이미지 하이라이트 추출 실패: path=%s, error=%s",
-                absolute_path,
-                exc,
-            )
-        except SpreadsheetExtractionError as exc:
-            logger.warning(
-                "스프레드시트 요약 생성 실패: path=%s, error=%s",
-                absolute_path,
-                exc,
-            )
+    lower_path = absolute_path.lower()
 
-    return insights
+    try:
+        if lower_path.endswith(".pdf"):
+            # 동시에 들어온 스냅샷 요청끼리도 PDF 추출이 겹치지 않도록 직렬화한다.
+            with _PDF_EXTRACTION_LOCK:
+                highlights = extract_pdf_keywords(absolute_path)
+            if not highlights:
+                return None, True
+            return FileInsights(
+                highlights=highlights,
+                caption=None,
+            ), True
+        elif lower_path.endswith(_IMAGE_EXTENSIONS):
+            image_highlights = extract_image_highlights(absolute_path)
+            combined_lines = list(image_highlights.ocr_lines)
+
+            if image_highlights.caption:
+                if image_highlights.caption not in combined_lines:
+                    combined_lines.append(image_highlights.caption)
+
+            if not combined_lines:
+                # 캡션 생성 실패(모델 미설치, 읽을 수 없는 파일 등)는 예외 없이 빈 결과로
+                # 돌아오므로, 빈 이미지로 보고 캐시에 남기지 않는다.
+                return None, False
+            return FileInsights(
+                highlights=combined_lines,
+                caption=image_highlights.caption,
+            ), True
+        elif lower_path.endswith(_SPREADSHEET_EXTENSIONS):
+            summary_text, signals = build_summary_text(absolute_path)
+            summary_text = summary_text.strip()
+
+            candidate_highlights: list[str] = []
+            seen_highlights: set[str] = set()
+            for value in (
+                signals.sections
+                + signals.banner
+                + signals.headers
+                + signals.samples
+            ):
+                cleaned = value.strip()
+                if not cleaned:
+                    continue
+                lowered = cleaned.lower()
+                if lowered in seen_highlights:
+                    continue
+                candidate_highlights.append(cleaned)
+                seen_highlights.add(lowered)
+                if len(candidate_highlights) >= 40:
+                    break
+
+            if not candidate_highlights and summary_text:
+                candidate_highlights.append(summary_text)
+
+            if not candidate_highlights:
+                return None, True
+
+            return FileInsights(
+                highlights=candidate_highlights,
+                caption=summary_text or None,
+            ), True
+
+    except PdfExtractionError as exc:
+        logger.warning(
+            "PDF 키워드 추출 실패: path=%s, error=%s",
+            absolute_path,
+            exc,
+        )
+        return None, False
+    except ImageExtractionError as exc:
+        logger.warning(
+            "이미지 하이라이트 추출 실패: path=%s, error=%s",
+            absolute_path,
+            exc,
+        )
+        return None, False
+    except SpreadsheetExtractionError as exc:
+        logger.warning(
+            "스프레드시트 요약 생성 실패: path=%s, error=%s",
+            absolute_path,
+            exc,
+        )
+        return None, False
+
+    return None, True
@@ -0,0 +1,11 @@
+"""Shared settings for the service layer's outbound httpx clients."""
+
+from __future__ import annotations
+
+# 모든 httpx 클라이언트가 같은 기준으로 HTTP/2 사용 여부를 정하도록 한 곳에서만 확인한다.
+try:
+    import h2  # type: ignore  # noqa: F401 - httpx[http2] 설치 여부 확인용
+except ImportError:
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import time
+from datetime import datetime
 from typing import Any, List, Optional
 
 import httpx
+import orjson
 
 from app.schemas.organized_file import (
     OrganizedFileEntry,
@@ -14,16 +19,35 @@ from app.schemas.organized_file import (
     OrganizedFileSaveResponse,
     FileEntryForGeneration,
     OrganizedFileSaveWithGenerationRequest,
+    SavedFile,
 )
+from app.services.http_support import HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# 이 파일 수 이상을 저장할 때는 응답 본문을 스트리밍으로 읽는다.
+# (가득 찬 청크가 스트리밍되도록 _SAVE_CHUNK_SIZE와 맞춘다)
+_STREAM_RESPONSE_MIN_FILES = 100
+
+# 이 파일 수를 넘는 저장 요청은 나누어 HTTP/2 커넥션 하나에서 동시에 전송한다.
+# 라우터 페이지 크기는 10~500(기본 100)이므로 101개 이상인 페이지부터 나뉜다.
+_SAVE_CHUNK_SIZE = 100
+_MAX_CONCURRENT_CHUNKS = 4
+
+# 연속 실패가 임계치에 도달하면 일정 시간 동안 요청을 즉시 실패 처리
+_CIRCUIT_FAILURE_THRESHOLD = 5
+_CIRCUIT_OPEN_SECONDS = 30.0
+
 
 class OrganizedFileClientError(Exception):
     """Organized Files API 클라이언트 에러"""
     pass
 
 
+class _RejectedRequestError(OrganizedFileClientError):
+    """Spring 서버가 요청 자체를 거절한 경우 (400/401)"""
+
+
 class OrganizedFileClient:
     """Spring 서버의 Organized Files API 클라이언트"""
 
@@ -47,12 +71,38 @@ class OrganizedFileClient:
         ).rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self._consecutive_failures = 0
+        self._circuit_opened_at = 0.0
+        self._inflight: dict[bytes, asyncio.Future[OrganizedFileSaveResponse]] = {}
 
         if not self.base_url:
             raise OrganizedFileClientError(
                 "SPRING_SERVER_URL 환경변수가 설정되지 않았습니다"
             )
 
+        # 커넥션 풀을 재사용하기 위해 클라이언트 수명 동안 하나의 AsyncClient 유지
+        # HTTP/2를 사용할 수 있으면 동시 저장 요청을 하나의 커넥션에서 멀티플렉싱
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+
+    async def close(self) -> None:
+        """내부 HTTP 커넥션 풀 종료"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "OrganizedFileClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     async def save_files(
         self,
         user_id: str,
@@ -73,7 +123,7 @@ class OrganizedFileClient:
         Raises:
             OrganizedFileClientError: API 호출 실패
         """
-        url = f"{self.base_url}/api/organized-files/save"
+        path = "/api/organized-files/save"
 
         # 요청 본문 준비
         request_data = OrganizedFileSaveRequest(
@@ -87,76 +137,7 @@ class OrganizedFileClient:
             f"file_count={len(files)}"
         )
 
-        for attempt in range(self.max_retries):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        url,
-                        json=request_data.model_dump(
-                            by_alias=True,
-                            exclude_none=True,
-                            mode="json"
-                        ),
-                        timeout=self.timeout,
-                    )
-
-                if response.status_code == 200:
-                    logger.info(
-                        f"파일 저장 성공: {response.json()['savedCount']} 저장, "
-                        f"{response.json()['updatedCount']} 업데이트"
-                    )
-                    return OrganizedFileSaveResponse(**response.json())
-
-                elif response.status_code == 400:
-                    error_data = response.json()
-                    raise OrganizedFileClientError(
-                        f"Bad Request: {error_data.get('error', 'Unknown error')}"
-                    )
-
-                elif response.status_code == 401:
-                    raise OrganizedFileClientError("Unauthorized: 인증 실패")
-
-                elif response.status_code == 500:
-                    error_data = response.json()
-                    logger.warning(
-                        f"Spring 서버 에러 (500). "
-                        f"재시도 {attempt + 1}/{self.max_retries}"
-                    )
-                    if attempt == self.max_retries - 1:
-                        raise OrganizedFileClientError(
-                            f"Server Error: {error_data.get('error', 'Unknown error')}"
-                        )
-                    continue
-
-                else:
-                    raise OrganizedFileClientError(
-                        f"Unexpected status code: {response.status_code}"
-                    )
-
-            except httpx.TimeoutException as exc:
-                logger.error(
-                    f"Spring 서버 타임아웃 ({self.timeout}초). "
-                    f"배치 처리 사용 권장"
-                )
-                raise OrganizedFileClientError(
-                    f"Spring 서버 타임아웃 ({self.timeout}초). "
-                    f"대량 파일 처리 시 배치 처리 사용 권장"
-                ) from exc
-
-            except httpx.RequestError as exc:
-                logger.warning(
-                    f"Spring 서버 연결 실패 "
-                    f"(시도 {attempt + 1}/{self.max_retries})"
-                )
-                if attempt == self.max_retries - 1:
-                    raise OrganizedFileClientError(
-                        f"Spring 서버 연결 실패: {str(exc)}"
-                    ) from exc
-                continue
-
-        raise OrganizedFileClientError(
-            f"최대 재시도 횟수 초과 ({self.max_retries})"
-        )
+        return await self._post_save(path, request_data)
 
     async def save_files_with_generation(
         self,
@@ -178,7 +159,7 @@ class OrganizedFileClient:
         Raises:
             OrganizedFileClientError: API 호출 실패
         """
-        url = f"{self.base_url}/api/organized-files/save"
+        path = "/api/organized-files/save"
 
         # 요청 본문 준비
         request_data = OrganizedFileSaveWithGenerationRequest(
@@ -192,34 +173,155 @@ class OrganizedFileClient:
             f"file_count={len(files)}"
         )
 
+        return await self._post_save(path, request_data)
+
+    async def _post_save(
+        self,
+        path: str,
+        request_data: OrganizedFileSaveRequest | OrganizedFileSaveWithGenerationRequest,
+    ) -> OrganizedFileSaveResponse:
+        """
+        저장 요청 전송 (대량 요청은 청크로 나누어 동시에 전송)
+
+        파일 수가 _SAVE_CHUNK_SIZE를 넘으면 청크별 요청을 최대 _MAX_CONCURRENT_CHUNKS개씩
+        동시에 보내고 결과를 하나의 응답으로 합친다. 일부 청크만 실패하면 성공한 청크의
+        결과에 실패한 청크의 파일 수를 failed_count로, 실패 사유를 error_messages로 더해
+        반환한다. 모든 청크가 실패한 경우에만 예외가 전파된다.
+        """
+        files = request_data.files
+        if len(files) <= _SAVE_CHUNK_SIZE:
+            return await self._post_save_chunk(path, request_data)
+
+        chunks = [
+            request_data.model_copy(update={"files": files[start : start + _SAVE_CHUNK_SIZE]})
+            for start in range(0, len(files), _SAVE_CHUNK_SIZE)
+        ]
+        logger.info(f"저장 요청을 {len(chunks)}개 청크로 나누어 전송")
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CHUNKS)
+
+        async def send(
+            chunk: OrganizedFileSaveRequest | OrganizedFileSaveWithGenerationRequest,
+        ) -> OrganizedFileSaveResponse:
+            async with semaphore:
+                return await self._post_save_chunk(path, chunk)
+
+        results = await asyncio.gather(
+            *(send(chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        responses: List[OrganizedFileSaveResponse] = []
+        failed_files = 0
+        failure_messages: List[str] = []
+        first_error: OrganizedFileClientError | None = None
+        for chunk_num, (chunk, result) in enumerate(zip(chunks, results), start=1):
+            if isinstance(result, OrganizedFileClientError):
+                logger.error(f"청크 {chunk_num}/{len(chunks)} 전송 실패: {result}")
+                failed_files += len(chunk.files)
+                failure_messages.append(f"청크 {chunk_num} 전송 실패: {result}")
+                first_error = first_error or result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                responses.append(result)
+
+        if not responses:
+            raise first_error
+
+        return _merge_save_responses(
+            responses,
+            failed_files=failed_files,
+            failure_messages=failure_messages,
+        )
+
+    async def _post_save_chunk(
+        self,
+        path: str,
+        request_data: OrganizedFileSaveRequest | OrganizedFileSaveWithGenerationRequest,
+    ) -> OrganizedFileSaveResponse:
+        """
+        단일 저장 요청 전송
+
+        동일한 본문의 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 공유한다.
+        (상위 레이어 재시도와 예약 동기화가 겹치는 경우 Spring 중복 저장 방지)
+        """
+        body = request_data.model_dump_json(
+            by_alias=True,
+            exclude_none=True,
+        ).encode("utf-8")
+        key = hashlib.blake2b(body, digest_size=16).digest()
+        # 응답의 savedFiles 크기는 파일 수에 비례하므로 파일 수로 스트리밍 여부 결정
+        stream = len(request_data.files) >= _STREAM_RESPONSE_MIN_FILES
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_guarded(path, body, stream=stream))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("동일한 저장 요청이 진행 중이므로 결과를 공유합니다")
+
+        return await asyncio.shield(task)
+
+    async def _send_guarded(
+        self,
+        path: str,
+        body: bytes,
+        *,
+        stream: bool = False,
+    ) -> OrganizedFileSaveResponse:
+        """
+        서킷 브레이커를 적용하여 저장 요청 전송
+
+        연속 실패가 임계치에 도달하면 일정 시간 동안 요청을 보내지 않고
+        즉시 실패시켜 Spring 서버 장애 시 재시도가 누적되는 것을 막는다.
+        """
+        self._check_circuit()
+
+        try:
+            response = await self._send_with_retries(path, body, stream=stream)
+        except _RejectedRequestError:
+            # 400/401은 서버 장애가 아니므로 실패 횟수에 포함하지 않는다.
+            raise
+        except OrganizedFileClientError:
+            self._record_failure()
+            raise
+
+        self._record_success()
+        return response
+
+    async def _send_with_retries(
+        self,
+        path: str,
+        body: bytes,
+        *,
+        stream: bool = False,
+    ) -> OrganizedFileSaveResponse:
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        url,
-                        json=request_data.model_dump(
-                            by_alias=True,
-                            exclude_none=True,
-                            mode="json"
-                        ),
-                        timeout=self.timeout,
-                    )
+                if stream:
+                    async with self._client.stream("POST", path, content=body) as response:
+                        if response.status_code == 200:
+                            return _build_save_response(
+                                await _read_json_stream(response)
+                            )
+                        # 에러 응답은 작으므로 전부 읽어 아래 공통 처리로 넘긴다.
+                        await response.aread()
+                else:
+                    response = await self._client.post(path, content=body)
 
                 if response.status_code == 200:
-                    logger.info(
-                        f"파일 저장 성공: {response.json()['savedCount']} 저장, "
-                        f"{response.json()['updatedCount']} 업데이트"
-                    )
-                    return OrganizedFileSaveResponse(**response.json())
+                    return _build_save_response(orjson.loads(response.content))
 
                 elif response.status_code == 400:
                     error_data = response.json()
-                    raise OrganizedFileClientError(
+                    raise _RejectedRequestError(
                         f"Bad Request: {error_data.get('error', 'Unknown error')}"
                     )
 
                 elif response.status_code == 401:
-                    raise OrganizedFileClientError("Unauthorized: 인증 실패")
+                    raise _RejectedRequestError("Unauthorized: 인증 실패")
 
                 elif response.status_code == 500:
                     error_data = response.json()
@@ -263,6 +365,30 @@ class OrganizedFileClient:
             f"최대 재시도 횟수 초과 ({self.max_retries})"
         )
 
+    def _check_circuit(self) -> None:
+        if self._consecutive_failures < _CIRCUIT_FAILURE_THRESHOLD:
+            return
+
+        elapsed = time.monotonic() - self._circuit_opened_at
+        if elapsed < _CIRCUIT_OPEN_SECONDS:
+            raise OrganizedFileClientError(
+                f"circuit open: Spring 서버 연속 실패 {self._consecutive_failures}회, "
+                f"{_CIRCUIT_OPEN_SECONDS - elapsed:.0f}초 후 재시도"
+            )
+
+    def _record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= _CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_opened_at = time.monotonic()
+            logger.warning(
+                f"Spring 서버 서킷 브레이커 열림 "
+                f"(연속 실패 {self._consecutive_failures}회, {_CIRCUIT_OPEN_SECONDS}초)"
+            )
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._circuit_opened_at = 0.0
+
     async def get_user_stats(self, user_id: str) -> dict[str, Any]:
         """
         사용자의 파일 통계 조회
@@ -276,14 +402,10 @@ class OrganizedFileClient:
         Raises:
             OrganizedFileClientError: API 호출 실패
         """
-        url = f"{self.base_url}/api/organized-files/user/{user_id}/stats"
+        path = f"/api/organized-files/user/{user_id}/stats"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    timeout=self.timeout,
-                )
+            response = await self._client.get(path)
 
             if response.status_code == 200:
                 return response.json()
@@ -315,16 +437,10 @@ class OrganizedFileClient:
         Raises:
             OrganizedFileClientError: API 호출 실패
         """
-        url = (
-            f"{self.base_url}/api/organized-files/user/{user_id}/bucket/{bucket}"
-        )
+        path = f"/api/organized-files/user/{user_id}/bucket/{bucket}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    timeout=self.timeout,
-                )
+            response = await self._client.get(path)
 
             if response.status_code == 200:
                 return response.json()
@@ -337,3 +453,101 @@ class OrganizedFileClient:
             raise OrganizedFileClientError(
                 f"파일 조회 네트워크 에러: {str(exc)}"
             ) from exc
+
+
+_shared_client: Optional[OrganizedFileClient] = None
+
+
+def get_organized_file_client() -> OrganizedFileClient:
+    """
+    프로세스 전역에서 공유하는 OrganizedFileClient 반환
+
+    요청마다 클라이언트를 만들면 커넥션 풀이 재사용되지 않으므로
+    라우터는 FastAPI Depends로 이 함수를 통해 클라이언트를 받는다.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = OrganizedFileClient()
+    return _shared_client
+
+
+async def close_organized_file_client() -> None:
+    """공유 클라이언트의 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+
+def _build_save_response(data: dict[str, Any]) -> OrganizedFileSaveResponse:
+    """
+    성공 응답(200)을 검증 없이 OrganizedFileSaveResponse로 변환
+
+    신뢰할 수 있는 Spring 서버의 성공 응답은 pydantic 검증을 건너뛰고
+    model_construct로 바로 만든다. 에러 응답은 기존처럼 방어적으로 처리한다.
+    """
+    logger.info(
+        f"파일 저장 성공: {data['savedCount']} 저장, "
+        f"{data['updatedCount']} 업데이트"
+    )
+    return OrganizedFileSaveResponse.model_construct(
+        total_processed=data["totalProcessed"],
+        saved_count=data["savedCount"],
+        updated_count=data["updatedCount"],
+        failed_count=data["failedCount"],
+        error_messages=data["errorMessages"],
+        saved_files=[
+            SavedFile.model_construct(
+                id=saved["id"],
+                original_relative_path=saved["originalRelativePath"],
+                korean_file_name=saved["koreanFileName"],
+                english_file_name=saved["englishFileName"],
+                para_bucket=saved["paraBucket"],
+                para_folder=saved.get("paraFolder"),
+                operation=saved["operation"],
+            )
+            for saved in data["savedFiles"]
+        ],
+        processed_at=datetime.fromisoformat(data["processedAt"]),
+    )
+
+
+def _merge_save_responses(
+    responses: List[OrganizedFileSaveResponse],
+    *,
+    failed_files: int = 0,
+    failure_messages: List[str] | None = None,
+) -> OrganizedFileSaveResponse:
+    """
+    청크별 저장 응답을 하나로 합침 (처리 시각은 가장 늦은 청크 기준)
+
+    전송 자체가 실패한 청크의 파일은 failed_files로 받아 처리·실패 수에 더한다.
+    """
+    return OrganizedFileSaveResponse.model_construct(
+        total_processed=(
+            sum(response.total_processed for response in responses) + failed_files
+        ),
+        saved_count=sum(response.saved_count for response in responses),
+        updated_count=sum(response.updated_count for response in responses),
+        failed_count=(
+            sum(response.failed_count for response in responses) + failed_files
+        ),
+        error_messages=[
+            message for response in responses for message in response.error_messages
+        ] + list(failure_messages or []),
+        saved_files=[saved for response in responses for saved in response.saved_files],
+        processed_at=max(response.processed_at for response in responses),
+    )
+
+
+async def _read_json_stream(response: httpx.Response) -> Any:
+    """
+    스트리밍 응답 본문을 하나의 버퍼에 모아 orjson으로 파싱
+
+    httpx의 청크 리스트 결합과 response.json()의 문자열 디코딩 복사를 건너뛰어
+    대용량 응답의 최대 메모리 사용량을 줄인다.
+    """
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes():
+        buffer += chunk
+    return orjson.loads(buffer)
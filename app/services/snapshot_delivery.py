@@ -3,16 +3,48 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Mapping
+import threading
+from typing import Any, Mapping, Optional
 
 import httpx
+import orjson
 
 from app.services.folder_inspection import DirectoryInspectionError
+from app.services.http_support import HTTP2_AVAILABLE
 
 
 _SERVER_URL_ENV = "SERVER_URL"
 _ENDPOINT_PATH = "/generate-filename"
 _DEFAULT_TIMEOUT = 10.0
+_MAX_KEEPALIVE_CONNECTIONS = 8
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """페이지마다 TCP/TLS 연결을 새로 맺지 않도록 프로세스 전역 클라이언트를 재사용"""
+    global _client
+    if _client is None:
+        # 스냅샷 엔드포인트는 스레드풀에서 실행되므로 생성 구간을 잠근다.
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=_DEFAULT_TIMEOUT,
+                    limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+                )
+    return _client
+
+
+def close_snapshot_delivery_client() -> None:
+    """공유 전송 클라이언트의 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
 
 
 def send_snapshot_payload(payload: Mapping[str, Any]) -> None:
@@ -29,8 +61,16 @@ def send_snapshot_payload(payload: Mapping[str, Any]) -> None:
 
     url = f"{base_url.rstrip('/')}{_ENDPOINT_PATH}"
 
+    # httpx의 json= 인자는 표준 json 모듈로 직렬화하므로 orjson으로 직접 바이트를 만든다.
+    body = orjson.dumps(payload)
+
     try:
-        response = httpx.post(url, json=payload, timeout=_DEFAULT_TIMEOUT)
+        response = _get_client().post(
+            url,
+            content=body,
+            headers=_JSON_HEADERS,
+            timeout=_DEFAULT_TIMEOUT,
+        )
     except httpx.HTTPError as exc:
         raise DirectoryInspectionError("스냅샷 데이터를 서버로 전송하지 못했습니다.") from exc
 
@@ -6,12 +6,19 @@ providing production-grade logic that can be imported from tests or sandboxes.
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
-import math
 import re
-from collections import Counter, defaultdict
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 __all__ = [
     "KeywordExtractor",
@@ -19,11 +26,15 @@ __all__ = [
 ]
 
 
-_SENTENCE_SPLIT_REGEX = re.compile(r"[.!?\n]+")
+# Sentence delimiters (``.``, ``!``, ``?``, newline) are folded onto "\n" so
+# splitting is a C-level translate + split instead of a regex scan.
+_SENTENCE_DELIM_TABLE = str.maketrans({".": "\n", "!": "\n", "?": "\n"})
 _TOKEN_REGEX = re.compile(r"[A-Za-z0-9]+|[가-힣]+", re.UNICODE)
 _CAMEL_CASE_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
+_EMBEDDING_CACHE_SIZE = 4096
+_BY_SCORE = attrgetter("score")
 
-_DEFAULT_STOPWORDS = {
+_DEFAULT_STOPWORDS: frozenset[str] = frozenset({
     # English stopwords
     "a",
     "about",
@@ -216,10 +227,10 @@ _DEFAULT_STOPWORDS = {
     "했다",
     "한다",
     "하는",
-}
+})
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class KeywordCandidate:
     """Container holding the candidate phrase and associated scores."""
 
@@ -245,14 +256,21 @@ class KeywordExtractor:
         semantic_model_name: str = "paraphrase-multilingual-MiniLM-L12-v2",
         enable_semantic_rerank: bool = True,
         metadata_only_penalty: float = 0.6,
+        embedding_cache_dir: Optional[Path] = None,
     ) -> None:
-        self.stopwords = {token.lower() for token in (stopwords or _DEFAULT_STOPWORDS)}
+        # The default set is already lowercase and shared across instances.
+        self.stopwords = (
+            frozenset(token.lower() for token in stopwords) if stopwords else _DEFAULT_STOPWORDS
+        )
         self.metadata_boost = metadata_boost
         self.camel_case_boost = camel_case_boost
         self.enable_semantic_rerank = enable_semantic_rerank
         self.semantic_model_name = semantic_model_name
         self.metadata_only_penalty = metadata_only_penalty
         self._semantic_model = None
+        self._model_lock = threading.Lock()
+        self.embedding_cache_dir = Path(embedding_cache_dir) if embedding_cache_dir else None
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
 
     @property
     def semantic_model(self) -> Any | None:
@@ -260,19 +278,25 @@ class KeywordExtractor:
             return None
         if self._semantic_model is not None:
             return self._semantic_model
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:  # pragma: no cover - executed only when dependency missing
-            self._semantic_model = None
-            self.enable_semantic_rerank = False
-            return None
-        try:
-            model = SentenceTransformer(self.semantic_model_name)
-        except Exception:  # pragma: no cover - model load failures should not crash tests
-            model = None
-            self.enable_semantic_rerank = False
-        self._semantic_model = model
-        return model
+        # Double-checked so concurrent extractions load the transformer only once.
+        with self._model_lock:
+            if not self.enable_semantic_rerank:
+                return None
+            if self._semantic_model is not None:
+                return self._semantic_model
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:  # pragma: no cover - executed only when dependency missing
+                self._semantic_model = None
+                self.enable_semantic_rerank = False
+                return None
+            try:
+                model = SentenceTransformer(self.semantic_model_name)
+            except Exception:  # pragma: no cover - model load failures should not crash tests
+                model = None
+                self.enable_semantic_rerank = False
+            self._semantic_model = model
+            return model
 
     def extract(
         self,
@@ -288,29 +312,35 @@ class KeywordExtractor:
         if not clean_text and not metadata_tokens:
             return []
 
-        candidates = self._generate_candidates(clean_text, metadata_tokens)
+        # Metadata is tokenized once and shared by candidate generation and the
+        # metadata-overlap set used during scoring.
+        metadata_sentence_tokens = [
+            self._tokenize(sentence)
+            for piece in metadata_tokens
+            for sentence in self._split_sentences(piece)
+        ]
+        candidates, stats = self._generate_candidates(clean_text, metadata_sentence_tokens)
         if not candidates:
             return []
 
-        scored = self._score_candidates(candidates, metadata_tokens)
-        reranked = self._maybe_semantic_rerank(clean_text, metadata_tokens, scored)
-
-        unique_phrases: MutableMapping[str, KeywordCandidate] = {}
-        for candidate in reranked:
-            normalized = candidate.phrase.lower()
-            if normalized in unique_phrases:
-                stored = unique_phrases[normalized]
-                if candidate.score > stored.score:
-                    unique_phrases[normalized] = candidate
-            else:
-                unique_phrases[normalized] = candidate
+        metadata_token_set = {
+            token.lower() for tokens in metadata_sentence_tokens for token in tokens
+        }
+        scored = self._score_candidates(candidates, stats, metadata_token_set)
+        # Deduplicate before the semantic rerank so each phrase is encoded once.
+        unique_candidates = self._dedupe(scored)
+        reranked = self._maybe_semantic_rerank(
+            clean_text, metadata_tokens, unique_candidates, top_k=top_k
+        )
 
-        ordered = sorted(
-            (cand for cand in unique_phrases.values() if cand.score >= min_score),
-            key=lambda item: item.score,
-            reverse=True,
+        # nlargest keeps only ``top_k`` items on a heap instead of sorting every
+        # candidate; ties resolve exactly as ``sorted(...)[:top_k]`` would.
+        ordered = heapq.nlargest(
+            max(top_k, 0),
+            (cand for cand in reranked if cand.score >= min_score),
+            key=_BY_SCORE,
         )
-        return [candidate.phrase for candidate in ordered[: max(top_k, 0)]]
+        return [candidate.phrase for candidate in ordered]
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -340,75 +370,81 @@ class KeywordExtractor:
     def _generate_candidates(
         self,
         text: str,
-        metadata_tokens: Sequence[str],
-    ) -> List[List[str]]:
-        sentences = self._split_sentences(text, metadata_tokens)
-        candidates: List[List[str]] = []
+        metadata_sentence_tokens: Sequence[Sequence[str]],
+    ) -> Tuple[List[Tuple[List[str], List[str]]], Dict[str, List[int]]]:
+        """Split sentences into candidate phrases and collect RAKE statistics.
+
+        Returns ``(tokens, lowered_tokens)`` pairs for every phrase together
+        with a ``token -> [frequency, degree]`` map. Both are built in the same
+        pass over the token stream: frequency is counted as a token joins a
+        phrase and the phrase length is added to its degree once the phrase
+        closes.
+        """
+        candidates: List[Tuple[List[str], List[str]]] = []
+        stats: Dict[str, List[int]] = {}
+        stopwords = self.stopwords
+        text_sentence_tokens = (
+            self._tokenize(sentence) for sentence in self._split_sentences(text)
+        )
 
-        for sentence in sentences:
-            tokens = self._tokenize(sentence)
+        for tokens in chain(metadata_sentence_tokens, text_sentence_tokens):
             if not tokens:
                 continue
             current_phrase: List[str] = []
+            current_phrase_lower: List[str] = []
+            current_entries: List[List[int]] = []
             for token in tokens:
-                lower = token.lower()
-                if lower in self.stopwords or len(lower) <= 1:
+                # _TOKEN_REGEX yields either pure ASCII or pure Hangul tokens, and
+                # Hangul has no case, so only ASCII tokens need lowering.
+                lower = token.lower() if token.isascii() else token
+                if lower in stopwords or len(lower) <= 1:
                     if current_phrase:
-                        candidates.append(current_phrase)
+                        length = len(current_phrase)
+                        for entry in current_entries:
+                            entry[1] += length
+                        candidates.append((current_phrase, current_phrase_lower))
                         current_phrase = []
+                        current_phrase_lower = []
+                        current_entries = []
                 else:
+                    entry = stats.get(lower)
+                    if entry is None:
+                        entry = stats[lower] = [0, 0]
+                    entry[0] += 1
                     current_phrase.append(token)
+                    current_phrase_lower.append(lower)
+                    current_entries.append(entry)
             if current_phrase:
-                candidates.append(current_phrase)
-        return candidates
+                length = len(current_phrase)
+                for entry in current_entries:
+                    entry[1] += length
+                candidates.append((current_phrase, current_phrase_lower))
+        return candidates, stats
 
-    def _split_sentences(self, text: str, metadata_tokens: Sequence[str]) -> List[str]:
-        material = text
-        if metadata_tokens:
-            material = "\n".join((*metadata_tokens, text))
-        sentences = [segment.strip() for segment in _SENTENCE_SPLIT_REGEX.split(material) if segment.strip()]
-        return sentences
+    def _split_sentences(self, text: str) -> List[str]:
+        segments = (segment.strip() for segment in text.translate(_SENTENCE_DELIM_TABLE).split("\n"))
+        return [segment for segment in segments if segment]
 
     def _tokenize(self, text: str) -> List[str]:
         return _TOKEN_REGEX.findall(text)
 
     def _score_candidates(
         self,
-        candidates: Sequence[Sequence[str]],
-        metadata_tokens: Sequence[str],
+        candidates: Sequence[Tuple[Sequence[str], Sequence[str]]],
+        stats: Mapping[str, Sequence[int]],
+        metadata_token_set: Set[str],
     ) -> List[KeywordCandidate]:
-        word_frequency: Counter[str] = Counter()
-        word_degree: MutableMapping[str, int] = defaultdict(int)
-
-        for candidate in candidates:
-            unique_tokens = [token.lower() for token in candidate]
-            length = len(unique_tokens)
-            for token in unique_tokens:
-                word_frequency[token] += 1
-                word_degree[token] += length
-
-        for token, freq in word_frequency.items():
-            word_degree[token] += freq - 1
-
         keyword_candidates: List[KeywordCandidate] = []
+        # Tokens repeat across phrases, so the camel-case check runs once per token.
+        camel_cache: Dict[str, bool] = {}
 
-        metadata_token_set = {
-            token.lower()
-            for sentence in metadata_tokens
-            for token in self._tokenize(sentence)
-        }
-
-        for candidate in candidates:
-            normalized_tokens = [token.lower() for token in candidate]
+        for candidate, normalized_tokens in candidates:
             if not normalized_tokens:
                 continue
             score = 0.0
             for token in normalized_tokens:
-                freq = word_frequency[token]
-                degree = word_degree[token]
-                if freq == 0:
-                    continue
-                score += degree / freq
+                freq, degree = stats[token]
+                score += (degree + freq - 1) / freq
             # Average to avoid bias toward very long phrases.
             score /= len(candidate)
 
@@ -418,8 +454,13 @@ class KeywordExtractor:
                 if metadata_overlap == len(candidate):
                     score *= self.metadata_only_penalty
 
-            if any(self._looks_like_camel_case(token) for token in candidate):
-                score *= 1.0 + self.camel_case_boost
+            for token in candidate:
+                is_camel = camel_cache.get(token)
+                if is_camel is None:
+                    is_camel = camel_cache[token] = self._looks_like_camel_case(token)
+                if is_camel:
+                    score *= 1.0 + self.camel_case_boost
+                    break
 
             phrase = self._recompose_phrase(candidate)
             keyword_candidates.append(
@@ -431,47 +472,116 @@ class KeywordExtractor:
             )
         return keyword_candidates
 
+    def _dedupe(self, candidates: Iterable[KeywordCandidate]) -> List[KeywordCandidate]:
+        """Keep the highest-scoring candidate per case-insensitive phrase."""
+        unique_phrases: MutableMapping[str, KeywordCandidate] = {}
+        for candidate in candidates:
+            normalized = candidate.phrase.lower()
+            stored = unique_phrases.get(normalized)
+            if stored is None or candidate.score > stored.score:
+                unique_phrases[normalized] = candidate
+        return list(unique_phrases.values())
+
     def _maybe_semantic_rerank(
         self,
         text: str,
         metadata_tokens: Sequence[str],
         candidates: Sequence[KeywordCandidate],
+        top_k: int = 8,
     ) -> List[KeywordCandidate]:
+        # Rerank only reorders phrases, so with nothing to return or fewer than
+        # two phrases the forward pass cannot change the result.
+        if top_k <= 0 or len(candidates) < 2:
+            return list(candidates)
         model = self.semantic_model
-        if model is None or not candidates:
+        if model is None:
             # No semantic rerank possible.
             return list(candidates)
 
         combined_text = "\n".join((*metadata_tokens, text)) if metadata_tokens else text
+        phrases = [candidate.phrase for candidate in candidates]
         try:
-            document_embedding = model.encode(combined_text, normalize_embeddings=True)
-            phrases = [candidate.phrase for candidate in candidates]
-            candidate_embeddings = model.encode(phrases, normalize_embeddings=True)
+            embeddings = self._encode_cached(model, [combined_text, *phrases])
         except Exception:  # pragma: no cover - defensive path when model fails
             return list(candidates)
+        document_embedding, candidate_embeddings = embeddings[0], embeddings[1:]
 
-        reranked: List[KeywordCandidate] = []
-        for candidate, embedding in zip(candidates, candidate_embeddings):
-            semantic_similarity = float(self._cosine_similarity(document_embedding, embedding))
-            semantic_boost = max(semantic_similarity, 0.0)
-            adjusted_score = candidate.score * (1.0 + semantic_boost)
-            reranked.append(
-                KeywordCandidate(
-                    phrase=candidate.phrase,
-                    score=adjusted_score,
-                    weight=candidate.weight,
+        # Embeddings are unit-normalised, so cosine similarity reduces to a
+        # single matrix-vector product over all candidates.
+        similarities = candidate_embeddings @ document_embedding
+
+        # Candidates are private to this extraction, so scores are updated in place.
+        reranked = list(candidates)
+        for candidate, semantic_similarity in zip(reranked, similarities.tolist()):
+            candidate.score *= 1.0 + max(semantic_similarity, 0.0)
+        reranked.sort(key=_BY_SCORE, reverse=True)
+        return reranked
+
+    def _encode_cached(self, model: Any, texts: Sequence[str]) -> np.ndarray:
+        """Encode ``texts`` while reusing embeddings computed for earlier calls.
+
+        Embeddings are keyed by model name and a hash of the text. Hits come
+        from an in-memory LRU and, when ``embedding_cache_dir`` is set, from
+        ``.npy`` files on disk; only the remaining misses reach the model.
+        """
+
+        keys = [self._embedding_cache_key(text) for text in texts]
+        rows: List[Optional[np.ndarray]] = [self._lookup_embedding(key) for key in keys]
+
+        misses = [index for index, row in enumerate(rows) if row is None]
+        if misses:
+            # One forward pass over every text not already cached.
+            encoded = np.asarray(
+                model.encode(
+                    [texts[index] for index in misses],
+                    normalize_embeddings=True,
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
                 )
             )
-        reranked.sort(key=lambda item: item.score, reverse=True)
-        return reranked
+            for index, embedding in zip(misses, encoded):
+                rows[index] = embedding
+                self._store_embedding(keys[index], embedding)
+
+        return np.stack(rows)
+
+    def _embedding_cache_key(self, text: str) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.semantic_model_name.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def _lookup_embedding(self, key: bytes) -> Optional[np.ndarray]:
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+        if self.embedding_cache_dir is None:
+            return None
+        try:
+            embedding = np.load(self.embedding_cache_dir / f"{key.hex()}.npy")
+        except (OSError, ValueError):
+            return None
+        self._remember_embedding(key, embedding)
+        return embedding
 
-    def _cosine_similarity(self, left: Sequence[float], right: Sequence[float]) -> float:
-        numerator = sum(x * y for x, y in zip(left, right))
-        left_norm = math.sqrt(sum(x * x for x in left))
-        right_norm = math.sqrt(sum(y * y for y in right))
-        if left_norm == 0.0 or right_norm == 0.0:
-            return 0.0
-        return numerator / (left_norm * right_norm)
+    def _store_embedding(self, key: bytes, embedding: np.ndarray) -> None:
+        self._remember_embedding(key, embedding)
+        if self.embedding_cache_dir is None:
+            return
+        try:
+            self.embedding_cache_dir.mkdir(parents=True, exist_ok=True)
+            np.save(self.embedding_cache_dir / f"{key.hex()}.npy", embedding)
+        except OSError:  # pragma: no cover - disk cache is best effort
+            pass
+
+    def _remember_embedding(self, key: bytes, embedding: np.ndarray) -> None:
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        while len(self._embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
 
     def _recompose_phrase(self, tokens: Sequence[str]) -> str:
         return " ".join(tokens)
@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 import pytest
 
 from tests.keyword_tooling.keyword_extractor import KeywordExtractor, extract_keywords
@@ -69,3 +70,56 @@ def test_extract_keywords_empty_inputs() -> None:
     assert extract_keywords(text="", metadata=None) == []
     assert extract_keywords(text="", metadata={}) == []
     assert extract_keywords(text="   ", metadata=None) == []
+
+
+class _StubSemanticModel:
+    """Embeds texts mentioning kafka along one axis and everything else along another."""
+
+    def encode(self, texts, **_: object):
+        def embed(text: str) -> list[float]:
+            return [1.0, 0.0] if "kafka" in text.lower() else [0.0, 1.0]
+
+        if isinstance(texts, str):
+            return np.asarray(embed(texts))
+        return np.asarray([embed(text) for text in texts])
+
+
+def test_semantic_rerank_boosts_phrases_similar_to_document() -> None:
+    extractor = KeywordExtractor()
+    extractor._semantic_model = _StubSemanticModel()
+    text = (
+        "Spark streaming jobs aggregate clickstream sessions. "
+        "Kafka topics buffer events"
+    )
+
+    keywords = extractor.extract(text=text, top_k=3)
+
+    assert "kafka" in keywords[0].lower()
+
+
+def test_semantic_rerank_reuses_cached_embeddings(tmp_path) -> None:
+    class CountingModel(_StubSemanticModel):
+        def __init__(self) -> None:
+            self.encoded: list[str] = []
+
+        def encode(self, texts, **kwargs: object):
+            self.encoded.extend([texts] if isinstance(texts, str) else texts)
+            return super().encode(texts, **kwargs)
+
+    text = "Kafka topics buffer events. Spark streaming jobs aggregate sessions"
+
+    first_model = CountingModel()
+    first = KeywordExtractor(embedding_cache_dir=tmp_path)
+    first._semantic_model = first_model
+    expected = first.extract(text=text, top_k=3)
+    encoded_once = len(first_model.encoded)
+    assert encoded_once > 0
+    assert first.extract(text=text, top_k=3) == expected
+    assert len(first_model.encoded) == encoded_once
+
+    # A fresh extractor pointed at the same directory reads embeddings from disk.
+    second_model = CountingModel()
+    second = KeywordExtractor(embedding_cache_dir=tmp_path)
+    second._semantic_model = second_model
+    assert second.extract(text=text, top_k=3) == expected
+    assert second_model.encoded == []
@@ -3,34 +3,48 @@
 import json
 from pathlib import Path
 
-import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.schemas.folder import FolderSnapshotResponse
 
 
 class _StubResponse:
     status_code = 200
 
 
+class _StubDeliveryClient:
+    def __init__(self, post):
+        self.post = post
+
+
 @pytest.fixture
 def snapshot_delivery_calls(monkeypatch):
     calls: list[dict[str, object]] = []
     monkeypatch.setenv("SERVER_URL", "http://example.com")
 
-    def fake_post(url: str, json: dict, timeout: float):
-        calls.append({"url": url, "json": json, "timeout": timeout})
+    def fake_post(url: str, content: bytes, headers: dict, timeout: float):
+        assert headers["Content-Type"] == "application/json"
+        calls.append({"url": url, "json": json.loads(content), "timeout": timeout})
         return _StubResponse()
 
-    monkeypatch.setattr(httpx, "post", fake_post)
+    monkeypatch.setattr(
+        "app.services.snapshot_delivery._client",
+        _StubDeliveryClient(fake_post),
+    )
     return calls
 
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    # Entering the context keeps one blocking portal (and event loop) alive for
+    # the whole module instead of starting a new one for every request.
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-def test_snapshot_creates_single_file(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_creates_single_file(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -74,7 +88,7 @@ def test_snapshot_creates_single_file(tmp_path, monkeypatch, snapshot_delivery_c
     )
 
 
-def test_snapshot_honors_page_size(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_honors_page_size(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -107,7 +121,7 @@ def test_snapshot_honors_page_size(tmp_path, monkeypatch, snapshot_delivery_call
         assert all(entry["is_development"] is False for entry in data["entries"])
 
 
-def test_snapshot_auto_batches_when_entries_large(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_auto_batches_when_entries_large(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -138,7 +152,7 @@ def test_snapshot_auto_batches_when_entries_large(tmp_path, monkeypatch, snapsho
     assert all(entry["is_development"] is False for entry in data["entries"])
 
 
-def test_snapshot_respects_depth_first_order(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_respects_depth_first_order(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -178,7 +192,7 @@ def test_snapshot_respects_depth_first_order(tmp_path, monkeypatch, snapshot_del
     ]
 
 
-def test_snapshot_skips_development_directories(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_skips_development_directories(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -234,7 +248,7 @@ def test_snapshot_skips_development_directories(tmp_path, monkeypatch, snapshot_
     assert development_relative_paths == {"git_project", "python_project"}
 
 
-def test_snapshot_sends_camel_case_payload(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_sends_camel_case_payload(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -269,7 +283,7 @@ def test_snapshot_sends_camel_case_payload(tmp_path, monkeypatch, snapshot_deliv
     assert all("isDirectory" in entry for entry in payload["entries"])
 
 
-def test_snapshot_includes_pdf_keywords(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_includes_pdf_keywords(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -311,7 +325,7 @@ def test_snapshot_includes_pdf_keywords(tmp_path, monkeypatch, snapshot_delivery
     assert "caption" not in pdf_entry
 
 
-def test_snapshot_includes_image_highlights(tmp_path, monkeypatch, snapshot_delivery_calls):
+def test_snapshot_includes_image_highlights(client, tmp_path, monkeypatch, snapshot_delivery_calls):
     target_dir = tmp_path / "source"
     target_dir.mkdir()
 
@@ -355,3 +369,184 @@ def test_snapshot_includes_image_highlights(tmp_path, monkeypatch, snapshot_deli
     assert "prompt" in image_entry
     assert "[OCR 상위 텍스트]" in image_entry["prompt"]
     assert "[이미지 캡션]" in image_entry["prompt"]
+
+
+def test_snapshot_response_matches_response_model(
+    client, tmp_path, monkeypatch, snapshot_delivery_calls
+):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+
+    (target_dir / "notes.txt").write_text("notes", encoding="utf-8")
+    project_dir = target_dir / "project"
+    project_dir.mkdir()
+    (project_dir / "package.json").write_text("{}", encoding="utf-8")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    for persist in (True, False):
+        response = client.post(
+            "/folders/snapshot",
+            json={"path": str(target_dir), "page_size": 1, "persist": persist},
+        )
+        assert response.status_code == 200
+
+        payload = response.json()
+        validated = FolderSnapshotResponse.model_validate(payload)
+
+        # The hand-built body carries exactly the model's fields, in its JSON form.
+        assert payload == validated.model_dump(mode="json")
+        assert validated.page_count == len(validated.pages)
+        assert [entry.relative_path for entry in validated.development_directories] == [
+            "project"
+        ]
+
+
+def test_snapshot_reuses_cached_extraction_for_unchanged_files(
+    client, tmp_path, monkeypatch, snapshot_delivery_calls
+):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+
+    pdf_path = target_dir / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 dummy")
+    empty_pdf_path = target_dir / "blank.pdf"
+    empty_pdf_path.write_bytes(b"%PDF-1.4 blank")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    extracted_paths: list[str] = []
+
+    def fake_extract(path: str, **_: object) -> list[str]:
+        extracted_paths.append(path)
+        return [] if path == str(empty_pdf_path) else ["Nebula"]
+
+    monkeypatch.setattr(
+        "app.services.folder_snapshot.extract_pdf_keywords",
+        fake_extract,
+    )
+
+    for _ in range(2):
+        response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+        assert response.status_code == 200
+
+    # Both files, including the one without keywords, are extracted only once.
+    assert sorted(extracted_paths) == sorted([str(pdf_path), str(empty_pdf_path)])
+    second_entries = snapshot_delivery_calls[-1]["json"]["entries"]
+    pdf_entry = next(entry for entry in second_entries if entry["relativePath"] == "report.pdf")
+    assert pdf_entry["keywords"] == ["Nebula"]
+
+    pdf_path.write_bytes(b"%PDF-1.4 edited content")
+    response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+    assert response.status_code == 200
+    assert extracted_paths.count(str(pdf_path)) == 2
+
+
+def test_snapshot_reextracts_file_renamed_to_another_extension(
+    client, tmp_path, monkeypatch, snapshot_delivery_calls
+):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+
+    pdf_path = target_dir / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 dummy")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    from app.extraction.handlers.image import ImageHighlights
+
+    image_paths: list[str] = []
+
+    def fake_image_highlights(path: str, **_: object) -> ImageHighlights:
+        image_paths.append(path)
+        return ImageHighlights(ocr_lines=[], caption="A chart")
+
+    monkeypatch.setattr(
+        "app.services.folder_snapshot.extract_pdf_keywords",
+        lambda path, **_: ["PDF HEADING"],
+    )
+    monkeypatch.setattr(
+        "app.services.folder_snapshot.extract_image_highlights",
+        fake_image_highlights,
+    )
+
+    response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+    assert response.status_code == 200
+
+    # A rename keeps inode, mtime and size, so only the extension tells them apart.
+    image_path = pdf_path.rename(target_dir / "report.png")
+    response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+    assert response.status_code == 200
+
+    assert image_paths == [str(image_path)]
+    image_entry = next(
+        entry
+        for entry in snapshot_delivery_calls[-1]["json"]["entries"]
+        if entry["relativePath"] == "report.png"
+    )
+    assert image_entry["keywords"] == ["A chart"]
+
+
+def test_snapshot_does_not_cache_images_without_caption(
+    client, tmp_path, monkeypatch, snapshot_delivery_calls
+):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+
+    image_path = target_dir / "unreadable.png"
+    image_path.write_bytes(b"not an image")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    from app.extraction.handlers.image import ImageHighlights
+
+    extracted_paths: list[str] = []
+
+    def failing_image_highlights(path: str, **_: object) -> ImageHighlights:
+        # Captioning errors are swallowed by the handler and surface as an empty result.
+        extracted_paths.append(path)
+        return ImageHighlights(ocr_lines=[], caption=None)
+
+    monkeypatch.setattr(
+        "app.services.folder_snapshot.extract_image_highlights",
+        failing_image_highlights,
+    )
+
+    for _ in range(2):
+        response = client.post("/folders/snapshot", json={"path": str(target_dir)})
+        assert response.status_code == 200
+
+    assert extracted_paths == [str(image_path), str(image_path)]
+
+
+def test_snapshot_without_persist_only_delivers(
+    client, tmp_path, monkeypatch, snapshot_delivery_calls
+):
+    target_dir = tmp_path / "source"
+    target_dir.mkdir()
+
+    for index in range(3):
+        (target_dir / f"file_{index}.txt").write_text(f"data-{index}", encoding="utf-8")
+
+    snapshot_root = tmp_path / "snapshots"
+    monkeypatch.setenv("SNAPSHOT_DIR", str(snapshot_root))
+
+    response = client.post(
+        "/folders/snapshot",
+        json={"path": str(target_dir), "page_size": 2, "persist": False},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+
+    assert payload["page_count"] == 2
+    assert [page["path"] for page in payload["pages"]] == [None, None]
+    assert [page["entry_count"] for page in payload["pages"]] == [2, 1]
+    assert list(snapshot_root.glob("*.json")) == []
+
+    assert len(snapshot_delivery_calls) == 2
+    assert [call["json"]["page"] for call in snapshot_delivery_calls] == [1, 2]
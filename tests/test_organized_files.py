@@ -115,6 +115,43 @@ class TestToOrganizedFileEntry:
         assert organized.para_bucket == ParaBucket.ARCHIVE
 
 
+def _make_entries(count: int) -> list[OrganizedFileEntry]:
+    """저장 요청용 OrganizedFileEntry를 count개 생성"""
+    return [
+        OrganizedFileEntry(
+            original_relative_path=f"file_{index}.txt",
+            directory=False,
+            development=False,
+            size_bytes=100,
+            modified_at=datetime.now(timezone.utc),
+            keywords=[],
+            korean_file_name=f"파일_{index}.txt",
+            english_file_name=f"file_{index}.txt",
+            para_bucket=ParaBucket.ARCHIVE,
+            reason="Test file",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_transport_client():
+    """handler로 응답하는 MockTransport를 설치한 OrganizedFileClient를 만드는 팩토리"""
+    import httpx
+
+    async def create(handler) -> OrganizedFileClient:
+        client = OrganizedFileClient(base_url="http://localhost:8080")
+        # 생성자가 만든 실제 AsyncClient는 쓰지 않으므로 교체 전에 닫는다.
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return create
+
+
 class TestOrganizedFileClient:
     """Spring 클라이언트 테스트"""
 
@@ -219,6 +256,200 @@ class TestOrganizedFileClient:
                     files=[entry],
                 )
 
+    @pytest.mark.asyncio
+    async def test_save_files_circuit_opens_after_consecutive_failures(self):
+        """연속 실패 후 서킷 브레이커가 열려 즉시 실패"""
+        client = OrganizedFileClient(
+            base_url="http://localhost:8080",
+            max_retries=1,
+        )
+
+        with patch('httpx.AsyncClient.post') as mock_post:
+            import httpx
+            mock_post.side_effect = httpx.ConnectError("Connection refused")
+
+            entry = OrganizedFileEntry(
+                original_relative_path="test.txt",
+                directory=False,
+                development=False,
+                size_bytes=100,
+                modified_at=datetime.now(timezone.utc),
+                keywords=["test"],
+                korean_file_name="테스트.txt",
+                english_file_name="test.txt",
+                para_bucket=ParaBucket.RESOURCES,
+                reason="Test file",
+            )
+
+            for _ in range(5):
+                with pytest.raises(OrganizedFileClientError, match="연결 실패"):
+                    await client.save_files(
+                        user_id="test_user",
+                        base_directory="/tmp",
+                        files=[entry],
+                    )
+
+            assert mock_post.call_count == 5
+
+            with pytest.raises(OrganizedFileClientError, match="circuit open"):
+                await client.save_files(
+                    user_id="test_user",
+                    base_directory="/tmp",
+                    files=[entry],
+                )
+
+            assert mock_post.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_saves_share_one_request(self):
+        """동일한 저장 요청이 동시에 들어오면 한 번만 전송"""
+        import asyncio
+        import httpx
+
+        client = OrganizedFileClient(base_url="http://localhost:8080")
+
+        with patch('httpx.AsyncClient.post') as mock_post:
+            mock_post.return_value = httpx.Response(
+                200,
+                json={
+                    "totalProcessed": 1,
+                    "savedCount": 1,
+                    "updatedCount": 0,
+                    "failedCount": 0,
+                    "errorMessages": [],
+                    "savedFiles": [],
+                    "processedAt": "2025-11-18T12:00:00Z",
+                },
+            )
+
+            entry = OrganizedFileEntry(
+                original_relative_path="test.txt",
+                directory=False,
+                development=False,
+                size_bytes=100,
+                modified_at=datetime(2025, 11, 18, tzinfo=timezone.utc),
+                keywords=["test"],
+                korean_file_name="테스트.txt",
+                english_file_name="test.txt",
+                para_bucket=ParaBucket.RESOURCES,
+                reason="Test file",
+            )
+
+            first, second = await asyncio.gather(
+                client.save_files(user_id="test_user", base_directory="/tmp", files=[entry]),
+                client.save_files(user_id="test_user", base_directory="/tmp", files=[entry]),
+            )
+
+            assert mock_post.call_count == 1
+            assert first.saved_count == second.saved_count == 1
+
+    @pytest.mark.asyncio
+    async def test_save_many_files_reads_streamed_response(self, mock_transport_client):
+        """대량 저장 시 스트리밍 응답 파싱"""
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/organized-files/save"
+            return httpx.Response(
+                200,
+                json={
+                    "totalProcessed": 100,
+                    "savedCount": 100,
+                    "updatedCount": 0,
+                    "failedCount": 0,
+                    "errorMessages": [],
+                    "savedFiles": [],
+                    "processedAt": "2025-11-18T12:00:00Z",
+                },
+            )
+
+        client = await mock_transport_client(handler)
+
+        async with client:
+            response = await client.save_files(
+                user_id="test_user",
+                base_directory="/tmp",
+                files=_make_entries(100),
+            )
+
+        assert response.saved_count == 100
+        assert response.total_processed == 100
+
+    @pytest.mark.asyncio
+    async def test_save_files_splits_large_requests_into_chunks(self, mock_transport_client):
+        """대량 저장 요청을 청크로 나누어 전송하고 결과 합산"""
+        import json
+        import httpx
+
+        received_counts: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            file_count = len(json.loads(request.content)["files"])
+            received_counts.append(file_count)
+            return httpx.Response(
+                200,
+                json={
+                    "totalProcessed": file_count,
+                    "savedCount": file_count,
+                    "updatedCount": 0,
+                    "failedCount": 0,
+                    "errorMessages": [],
+                    "savedFiles": [],
+                    "processedAt": "2025-11-18T12:00:00Z",
+                },
+            )
+
+        client = await mock_transport_client(handler)
+
+        async with client:
+            response = await client.save_files(
+                user_id="test_user",
+                base_directory="/tmp",
+                files=_make_entries(450),
+            )
+
+        assert sorted(received_counts) == [50, 100, 100, 100, 100]
+        assert response.total_processed == 450
+        assert response.saved_count == 450
+
+    @pytest.mark.asyncio
+    async def test_save_files_reports_partial_chunk_failure(self, mock_transport_client):
+        """일부 청크만 실패하면 성공한 청크 결과와 실패 파일 수를 함께 반환"""
+        import json
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            files = json.loads(request.content)["files"]
+            if files[0]["originalRelativePath"] == "file_100.txt":
+                return httpx.Response(400, json={"error": "invalid chunk"})
+            return httpx.Response(
+                200,
+                json={
+                    "totalProcessed": len(files),
+                    "savedCount": len(files),
+                    "updatedCount": 0,
+                    "failedCount": 0,
+                    "errorMessages": [],
+                    "savedFiles": [],
+                    "processedAt": "2025-11-18T12:00:00Z",
+                },
+            )
+
+        client = await mock_transport_client(handler)
+
+        async with client:
+            response = await client.save_files(
+                user_id="test_user",
+                base_directory="/tmp",
+                files=_make_entries(300),
+            )
+
+        assert response.saved_count == 200
+        assert response.failed_count == 100
+        assert response.total_processed == 300
+        assert len(response.error_messages) == 1
+        assert "invalid chunk" in response.error_messages[0]
+
     @pytest.mark.asyncio
     async def test_get_user_stats(self):
         """사용자 통계 조회"""